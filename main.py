@@ -2,12 +2,101 @@
 Script ini digunakan untuk mendapatkan latitude, longitude, google maps url & image url
 """
 
+import hashlib
 import os
-import psycopg2
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+
 import requests
+import requests_cache
 import pandas as pd
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from requests.adapters import HTTPAdapter
+from sqlalchemy import create_engine, text
+from tqdm import tqdm
+from urllib3.util.retry import Retry
+
+
+# Jumlah thread untuk memproses baris secara paralel, sekaligus jumlah koneksi di pool session
+MAX_WORKERS = 16
+
+# Jumlah baris per potongan, tiap potongan langsung disimpan ke postgres & checkpoint
+CHUNK_SIZE = 500
+CHECKPOINT_DIR = "checkpoint"
+
+QUERY_COLUMNS = ["name", "alamat_parameter", "query_v1", "query_v2"]
+RESULT_COLUMNS = ["place_id", "map_url", "latitude", "longitude", "image_url"]
+COORDINATE_COLUMNS = ["latitude", "longitude"]
+
+# Tipe lokasi google maps yang dianggap sebagai fasilitas kesehatan
+TYPE_OPTIONS = frozenset({"health", "hospital", "pharmacy", "dentist"})
+
+# Format url google maps dari place_id (url scheme resmi google maps)
+MAP_URL_FORMAT = "https://www.google.com/maps/place/?q=place_id:{place_id}"
+
+# Status api places yang berarti permintaan berhasil (ZERO_RESULTS = lokasi tidak ditemukan)
+PLACES_SUCCESS_STATUSES = ("OK", "ZERO_RESULTS")
+
+# Cache di memori: kata kunci findplace yang sudah dinormalisasi -> candidate (None jika tidak ketemu)
+FINDPLACE_CACHE = {}
+
+
+def is_cacheable_response(response):
+    """
+    Function untuk mengecek apakah respon api boleh disimpan di cache
+
+    Args :
+        response : respon dari api
+
+    Returns :
+        response : true jika status respon OK atau ZERO_RESULTS
+    """
+    try:
+        return response.json().get("status") in PLACES_SUCCESS_STATUSES
+    except ValueError:
+        return False
+
+
+def create_http_adapter():
+    """
+    Function untuk membuat adapter http ke google maps
+
+    Returns :
+        adapter : HTTPAdapter dengan pool koneksi & retry
+    """
+    # pool_block membuat thread menunggu koneksi yang ada daripada membuka koneksi baru yang dibuang
+    return HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=MAX_WORKERS,
+        pool_block=True,
+        # Error sementara (429/5xx/koneksi) di-retry di sini dengan exponential backoff
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+        ),
+    )
+
+
+# Session dipakai bersama oleh semua request ke google maps agar koneksi TLS dipakai ulang.
+# Respon findplace & details disimpan di sqlite (gmaps_cache.sqlite) supaya run berikutnya
+# dan alamat yang sama tidak memanggil api lagi.
+SESSION = requests_cache.CachedSession(
+    cache_name="gmaps_cache",
+    backend="sqlite",
+    expire_after=timedelta(days=30),
+    allowable_codes=[200],
+    ignored_parameters=["key"],
+    filter_fn=is_cacheable_response,
+)
+SESSION.mount("https://", create_http_adapter())
+
+# Redirect foto tidak perlu di-cache, jadi memakai session biasa agar tidak melewati
+# filter_fn cache (respon yang ditolak filter dihapus dari sqlite dan memicu VACUUM)
+PHOTO_SESSION = requests.Session()
+PHOTO_SESSION.mount("https://", create_http_adapter())
 
 
 def check_type_in_response(store_type):
@@ -15,22 +104,35 @@ def check_type_in_response(store_type):
     Function untuk mengecek tipe toko dari data yang diterima
 
     Args :
-        response_json : data dari api
+        store_type : list tipe lokasi dari candidate api
 
     Returns :
         response : true atau false dari pengecekan
     """
-    type_options = ["health", "hospital", "pharmacy", "dentist"]
-    return any(type_option in store_type for type_option in type_options)
+    return not TYPE_OPTIONS.isdisjoint(store_type)
+
+
+def normalize_query(value):
+    """
+    Function untuk menyeragamkan kata kunci pencarian agar cache tidak terpecah
+
+    Args :
+        value : parameter yang digunakan sebagai kata kunci
+
+    Returns :
+        value : kata kunci dalam huruf kecil tanpa spasi berlebih
+    """
+    return " ".join(str(value).split()).lower()
 
 
-def get_place_api(value, api_key):
+def get_place_api(value, api_key, session=SESSION):
     """
     Function untuk mendapatkan data api google maps
 
     Args :
         value : parameter yang digunakan sebagai kata kunci
         api_key : api key google maps
+        session : session requests yang dipakai
 
     Returns :
         response : respon dari api
@@ -38,72 +140,84 @@ def get_place_api(value, api_key):
     endpoint = "https://maps.googleapis.com/maps/api/place/findplacefromtext/json"
 
     params = {
-        "input": value,
+        "input": normalize_query(value),
         "inputtype": "textquery",
-        "fields": "formatted_address,name,place_id,types",
+        "fields": "formatted_address,name,place_id,types,geometry,photos",
         "key": api_key,
     }
 
     if value is not None:
-        response = requests.get(endpoint, params=params, timeout=10)
+        response = session.get(endpoint, params=params, timeout=10)
     else:
         response = None
     return response
 
 
-def get_place_id_from_text_query(row_value, api_key):
+def get_place_from_text_query(queries, api_key, session=SESSION):
     """
-    Function untuk mendapatkan data place_id dari api google maps
+    Function untuk mendapatkan data lokasi (place_id, geometry & photos) dari api google maps
 
     Args :
-        row_value : data perbaris dari dataframe
+        queries : list kata kunci yang dicoba berurutan sampai lokasi ditemukan
         api_key : api key google maps
+        session : session requests yang dipakai
 
     Returns :
-        place_id : ID dari lokasi per data
-    """
-    place_id = None
+        place : candidate dari api, None jika tidak ditemukan
 
-    max_retries = 3
-    retry_count = 0
+    Raises :
+        requests.RequestException / ValueError : jika api tetap gagal setelah retry dari session,
+            kata kunci lain tidak dicoba karena kegagalannya bukan karena kata kunci
+    """
+    place = None
 
-    while place_id is None and retry_count < max_retries:
-        value = None
+    for value in queries:
+        if place is not None:
+            break
 
-        # Menentukan value berdasarkan retry countnya
-        if retry_count == 0:
-            value = row_value["alamat_parameter"]
-        elif retry_count == 1:
-            value = row_value["name"] + ", " + row_value["city"]
-        elif retry_count == 2:
-            value = row_value["address"]
+        # Kata kunci yang sudah pernah dicari (di baris ini atau baris lain) tidak dipanggil lagi
+        cache_key = normalize_query(value) if value is not None else None
+        if cache_key in FINDPLACE_CACHE:
+            place = FINDPLACE_CACHE[cache_key]
+            continue
 
         # panggil fungsi untuk memanggil api dan mendapatkan responnya
-        response = get_place_api(value, api_key)
+        response = get_place_api(value, api_key, session)
+        if response is None:
+            continue
+
+        # Error http yang lolos dari retry session tidak dianggap sebagai kata kunci yang salah
+        response.raise_for_status()
 
-        if response.status_code == 200:
-            response_json = response.json()
+        # Respon 200 yang bukan json adalah kegagalan api, ValueError diteruskan ke pemanggil
+        response_json = response.json()
 
-            # Looping data berdasarkan jumlah data yang diterima dari api
-            for i in range(len(response_json["candidates"])):
-                # Pengecekan tipe toko dari data yang diterima dari api
-                # if check_type_in_response(response_json, i):
-                if check_type_in_response(response_json["candidates"][i]["types"]):
-                    place_id = response_json["candidates"][i]["place_id"]
-                    break
+        # Error dari api places (misal OVER_QUERY_LIMIT, REQUEST_DENIED)
+        if response_json.get("status") not in PLACES_SUCCESS_STATUSES:
+            raise ValueError(f"Places API error: {response_json.get('status')}")
 
-        retry_count += 1
+        # Looping data berdasarkan jumlah data yang diterima dari api
+        for i in range(len(response_json["candidates"])):
+            # Pengecekan tipe toko dari data yang diterima dari api
+            # if check_type_in_response(response_json, i):
+            if check_type_in_response(response_json["candidates"][i]["types"]):
+                place = response_json["candidates"][i]
+                break
 
-    return place_id
+        # Hanya di sini kata kunci berikutnya dicoba: respon berhasil tapi tidak ada yang cocok
+        FINDPLACE_CACHE[cache_key] = place
 
+    return place
 
-def get_place_info_from_place_id(place_id, api_key):
+
+def get_place_info_from_place_id(place_id, api_key, session=SESSION):
     """
     Function untuk mendapatkan data place_id dari api google maps
 
     Args :
         row_value : data perbaris dari dataframe
         api_key : api key google maps
+        session : session requests yang dipakai
 
     Returns :
         place_id : ID dari lokasi per data
@@ -113,22 +227,25 @@ def get_place_info_from_place_id(place_id, api_key):
     params = {
         "place_id": place_id,
         "key": api_key,
-        "fields": "url,photos,geometry",
+        "fields": "photos,geometry",
     }
 
-    response = requests.get(endpoint, params=params, timeout=10)
+    response = session.get(endpoint, params=params, timeout=10)
     response_json = response.json()
 
     return response_json
 
 
-def get_image_url_from_photo_preference(photo_reference, api_key):
+def get_image_url_from_photo_preference(
+    photo_reference, api_key, session=PHOTO_SESSION
+):
     """
     Function untuk mendapatkan data url image dari api google maps
 
     Args :
         photo_reference : data photo reference
         api_key : api key google maps
+        session : session requests yang dipakai
 
     Returns :
         image_url : Url dari gambar
@@ -141,18 +258,24 @@ def get_image_url_from_photo_preference(photo_reference, api_key):
         "key": api_key,
     }
 
-    response = requests.get(endpoint, params=params, timeout=10)
-    image_url = response.url
+    # Cukup ambil url tujuan redirect dari header Location, gambar tidak ikut didownload.
+    # Url dari Location tidak mengandung api key sehingga aman disimpan.
+    response = session.get(
+        endpoint, params=params, timeout=10, allow_redirects=False, stream=True
+    )
+    try:
+        image_url = response.headers["Location"]
+    finally:
+        response.close()
     return image_url
 
 
-def check_table_exits(connection, cursor):
+def check_table_exits(engine):
     """
     Function untuk melakukan pengecekan apakah table sudah ada
 
     Args :
-        connection : connection postgres
-        cursor : cursor postgres
+        engine : engine sqlalchemy postgres
     """
     create_table_query = """
         CREATE TABLE IF NOT EXISTS public.list_rumah_sakit (
@@ -162,35 +285,163 @@ def check_table_exits(connection, cursor):
         name text NULL,
         address text NULL,
         map_url text NULL,
-        latitude varchar(255) NULL,
-        longitude varchar(255) NULL,
+        latitude double precision NULL,
+        longitude double precision NULL,
         image_url text NULL
     );
     """
 
-    # Execute query
-    cursor.execute(create_table_query)
-
-    # Commit the transaction
-    connection.commit()
+    # Execute query, transaksi otomatis di-commit di akhir blok
+    with engine.begin() as connection:
+        connection.execute(text(create_table_query))
 
 
-def insert_data(data_frame, db_url):
+def insert_data(data_frame, engine):
     """
     Function untuk memasukkan data ke postgres dari data_frame
 
     Args :
         data_frame : dataframe dari data yang diterima
-        db_url : link url untuk database
+        engine : engine sqlalchemy postgres
+    """
+    table_name = "list_rumah_sakit"
+
+    # Masukkan data data_frame ke database, satu INSERT multi-row per 1000 baris
+    data_frame.to_sql(
+        table_name,
+        engine,
+        if_exists="append",
+        index=False,
+        method="multi",
+        chunksize=1000,
+    )
+
+
+def process_row(index, row, api_key, session=SESSION):
+    """
+    Function untuk mendapatkan place_id, map url, latitude, longitude & image url per baris
+
+    Args :
+        index : index baris di dataframe
+        row : data perbaris dari dataframe (namedtuple dari itertuples)
+        api_key : api key google maps
+        session : session requests yang dipakai untuk findplace & details
 
     Returns :
-        image_url : Url dari gambar
+        result : tuple (index, success, place_id, map_url, latitude, longitude,
+            image_url). success false jika terjadi error (boleh dicoba lagi), lokasi
+            yang tidak ditemukan atau tanpa foto tetap dianggap berhasil.
+            latitude & longitude berupa float atau None
     """
-    table_name = "list_rumah_sakit"
-    engine = create_engine(db_url)
+    place_id = map_url = image_url = ""
+    latitude = longitude = None
+    success = False
+
+    try:
+        # Panggil fungsi untuk mendapatkan lokasi (place_id, geometry & photos)
+        queries = [row.alamat_parameter, row.query_v1, row.query_v2]
+        place = get_place_from_text_query(queries, api_key, session)
+        if place is None:
+            return index, True, place_id, map_url, latitude, longitude, image_url
+        place_id = str(place["place_id"])
+
+        # Data detail hanya dipanggil jika findplace tidak mengembalikan geometry
+        if "geometry" not in place:
+            place = get_place_info_from_place_id(place_id, api_key, session)["result"]
+
+        map_url = MAP_URL_FORMAT.format(place_id=place_id)
+        latitude = place["geometry"]["location"]["lat"]
+        longitude = place["geometry"]["location"]["lng"]
+
+        # Memanggil fungsi untuk mendapatkan url gambar (gambar yang diambil hanya gambar pertama saja karena keterbatasan limit api)
+        if place.get("photos"):
+            image_url = get_image_url_from_photo_preference(
+                photo_reference=place["photos"][0]["photo_reference"],
+                api_key=api_key,
+            )
+
+        success = True
+
+    except Exception as error:
+        # Tangani kesalahan yang terjadi, baris lain tetap diproses
+        tqdm.write(f"Error processing address at index {index}: {str(error)}")
+
+    return index, success, place_id, map_url, latitude, longitude, image_url
 
-    # Masukkan data data_frame ke database
-    data_frame.to_sql(table_name, engine, if_exists="append", index=False)
+
+def chunk_fingerprint(chunk):
+    """
+    Function untuk membuat hash dari isi potongan dataframe (termasuk posisi baris)
+
+    Args :
+        chunk : potongan dataframe dari file excel
+
+    Returns :
+        fingerprint : 16 karakter hex dari sha256 isi potongan
+    """
+    row_hashes = pd.util.hash_pandas_object(chunk, index=True).to_numpy()
+    return hashlib.sha256(row_hashes.tobytes()).hexdigest()[:16]
+
+
+def process_chunk(chunk, executor, lookup, progress, api_key, session=SESSION):
+    """
+    Function untuk memproses satu potongan dataframe secara paralel
+
+    Args :
+        chunk : potongan dataframe yang akan diproses
+        executor : ThreadPoolExecutor yang dipakai bersama untuk semua potongan
+        lookup : hasil yang berhasil per alamat_parameter yang sudah dinormalisasi,
+            dipakai bersama untuk semua potongan agar alamat yang sama hanya diproses sekali
+        progress : progress bar tqdm untuk semua baris
+        api_key : api key google maps
+        session : session requests yang dipakai
+
+    Returns :
+        chunk : salinan potongan dataframe dengan kolom hasil api
+        failed_count : jumlah alamat yang gagal diproses karena error
+    """
+    chunk = chunk.copy()
+    keys = chunk["alamat_parameter"].map(normalize_query)
+
+    # Hanya alamat yang belum pernah diproses yang dipanggil ke api, satu baris per alamat
+    pending = ~keys.duplicated() & ~keys.isin(list(lookup))
+    rows = chunk.loc[pending, QUERY_COLUMNS].itertuples(index=False, name="Row")
+
+    futures = {
+        executor.submit(process_row, index, row, api_key, session): (key, row)
+        for index, key, row in zip(chunk.index[pending], keys[pending], rows)
+    }
+    chunk_results = {}
+    failed_count = 0
+    for future in as_completed(futures):
+        _, success, *values = future.result()
+        key, row = futures[future]
+        chunk_results[key] = values
+
+        # Hanya hasil yang berhasil dipakai lagi di potongan berikutnya, alamat yang gagal
+        # (misal OVER_QUERY_LIMIT) dicoba lagi saat muncul di potongan lain
+        if success:
+            lookup[key] = values
+        else:
+            failed_count += 1
+
+        progress.update(1)
+        progress.set_postfix(name=str(row.name)[:30], refresh=False)
+
+    # Baris dengan alamat yang sudah pernah diproses langsung dihitung selesai
+    progress.update(len(chunk) - len(futures))
+
+    # Hasil dimasukkan ke semua baris dengan alamat yang sama sekaligus per kolom
+    results = [
+        chunk_results[key] if key in chunk_results else lookup[key] for key in keys
+    ]
+    for position, column in enumerate(RESULT_COLUMNS):
+        chunk[column] = [values[position] for values in results]
+
+    # Koordinat disimpan sebagai float (NaN jika tidak ditemukan), bukan string
+    chunk[COORDINATE_COLUMNS] = chunk[COORDINATE_COLUMNS].astype("float64")
+
+    return chunk, failed_count
 
 
 def main():
@@ -205,9 +456,10 @@ def main():
     name_db = os.getenv("DATABASE_NAME")
     user_db = os.getenv("DATABASE_USER")
     password_db = os.getenv("DATABASE_PASSWORD")
+    write_checkpoint = os.getenv("WRITE_CHECKPOINT")
 
-    # Ambil data excel dari file
-    data_frame = pd.read_excel("list-provider.xlsx")
+    # Ambil data excel dari file (engine calamine jauh lebih cepat dari openpyxl untuk membaca)
+    data_frame = pd.read_excel("list-provider.xlsx", engine="calamine")
 
     data_frame["alamat_parameter"] = (
         data_frame["name"].astype(str)
@@ -216,77 +468,119 @@ def main():
         + ", "
         + data_frame["city"].astype(str)
     )
-    data_frame["place_id"] = ""
-    data_frame["map_url"] = ""
-    data_frame["latitude"] = ""
-    data_frame["longitude"] = ""
-    data_frame["image_url"] = ""
-
-    print("Mulai untuk mendapatkan latitude, longitude, google maps url & image url")
-    for index, row in data_frame.iterrows():
-        try:
-            print(f"Processing address at index {index}: {row['name']}")
-            # Panggil fungsi untuk mendapatkan URL gambar
-            place_id = str(get_place_id_from_text_query(row, api_key))
-
-            # Simpan URL gambar ke dalam DataFrame atau struktur data lainnya
-            data_frame.at[index, "place_id"] = place_id
-
-            # Memanggil fungsi untuk mendapatkan data detail
-            place_result = get_place_info_from_place_id(place_id, api_key)
-            data_frame.at[index, "map_url"] = str(place_result["result"]["url"])
-            data_frame.at[index, "latitude"] = str(
-                place_result["result"]["geometry"]["location"]["lat"]
-            )
-            data_frame.at[index, "longitude"] = str(
-                place_result["result"]["geometry"]["location"]["lng"]
-            )
-            # Memanggil fungsi untuk mendapatkan url gambar (gambar yang diambil hanya gambar pertama saja karena keterbatasan limit api)
-            image_url = get_image_url_from_photo_preference(
-                photo_reference=place_result["result"]["photos"][0]["photo_reference"],
-                api_key=api_key,
-            )
-            data_frame.at[index, "image_url"] = image_url
-
-        except Exception as error:
-            # Tangani kesalahan yang terjadi
-            print(f"Error processing address at index {index}: {str(error)}")
-
-    print("Selesai mendapatkan latitude, longitude, google maps url & image url")
-
-    data_frame.to_excel("output_file_selesai_belum.xlsx", index=False)
+    # Kata kunci cadangan jika alamat_parameter tidak menemukan lokasi
+    data_frame["query_v1"] = (
+        data_frame["name"].astype(str) + ", " + data_frame["city"].astype(str)
+    )
+    data_frame["query_v2"] = data_frame["address"].astype(str)
 
     columns_to_delete = [
         "alamat_parameter",
+        "query_v1",
+        "query_v2",
         "place_id",
     ]
 
-    # Hapus kolom yang tidak dipakai
-    data_frame = data_frame.drop(columns=columns_to_delete)
-
+    # Satu engine dipakai untuk cek table dan insert data tiap potongan
+    engine = None
     try:
         db_url = f"postgresql://{user_db}:{password_db}@{host_db}/{name_db}"
-
-        # Establish a database connection
-        connection = psycopg2.connect(db_url)
-
-        # Create a cursor object
-        cursor = connection.cursor()
-
-        check_table_exits(connection, cursor)
-        insert_data(data_frame, db_url)
-
+        engine = create_engine(db_url, pool_size=5, pool_pre_ping=True)
+        check_table_exits(engine)
     except Exception as error:
-        print("Error while connecting to PostgreSQL:", error)
+        tqdm.write(f"Error while connecting to PostgreSQL: {error}")
+        if engine is not None:
+            engine.dispose()
+        engine = None
+
+    if write_checkpoint:
+        os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+
+    chunks = []
+    lookup = {}
+    progress = tqdm(
+        total=len(data_frame), desc="latitude, longitude, map url & image url"
+    )
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for chunk_id, start in enumerate(range(0, len(data_frame), CHUNK_SIZE)):
+                chunk_input = data_frame.iloc[start : start + CHUNK_SIZE]
+
+                # Nama checkpoint memuat hash isi potongan, jadi excel yang berubah tidak
+                # memakai checkpoint lama
+                checkpoint_path = os.path.join(
+                    CHECKPOINT_DIR,
+                    f"chunk_{chunk_id}_{chunk_fingerprint(chunk_input)}",
+                )
+                result_path = f"{checkpoint_path}.parquet"
+                inserted_path = f"{checkpoint_path}.inserted"
+
+                # Hasil api dari run sebelumnya tidak diproses lagi
+                if write_checkpoint and os.path.exists(result_path):
+                    tqdm.write(f"Chunk {chunk_id} dibaca dari checkpoint")
+                    chunk = pd.read_parquet(result_path)
+                    progress.update(len(chunk))
+                else:
+                    chunk, failed_count = process_chunk(
+                        chunk_input, executor, lookup, progress, api_key
+                    )
+
+                    # Hapus kolom yang tidak dipakai
+                    chunk = chunk.drop(columns=columns_to_delete)
+
+                    # Potongan dengan alamat yang error (misal OVER_QUERY_LIMIT) tidak
+                    # di-checkpoint maupun di-insert, supaya diproses ulang di run berikutnya
+                    # dan baris kosongnya tidak masuk postgres
+                    if write_checkpoint and failed_count:
+                        tqdm.write(
+                            f"Chunk {chunk_id}: {failed_count} alamat gagal, "
+                            "diproses ulang di run berikutnya"
+                        )
+                        chunks.append(chunk)
+                        continue
+
+                    # Hasil api langsung disimpan (parquet jauh lebih cepat dari xlsx),
+                    # terpisah dari status insert supaya tetap ada walaupun postgres gagal
+                    if write_checkpoint:
+                        chunk.to_parquet(result_path, index=False)
+
+                chunks.append(chunk)
+
+                # Potongan yang sudah pernah berhasil di-insert tidak di-insert lagi
+                if engine is None or (
+                    write_checkpoint and os.path.exists(inserted_path)
+                ):
+                    continue
+
+                try:
+                    insert_data(chunk, engine)
+                except Exception as error:
+                    tqdm.write(f"Error while inserting chunk {chunk_id}: {error}")
+                    continue
+
+                if write_checkpoint:
+                    with open(inserted_path, "w", encoding="utf-8"):
+                        pass
 
     finally:
-        # Close the cursor and connection
-        if cursor:
-            cursor.close()
-        if connection:
-            connection.close()
+        progress.close()
+
+        # Tutup session http yang dipakai untuk google maps
+        SESSION.close()
+        PHOTO_SESSION.close()
+
+        # Tutup semua koneksi di pool engine
+        if engine is not None:
+            engine.dispose()
 
     # Simpan DataFrame dengan hasil URL gambar ke file Excel
+    if chunks:
+        data_frame = pd.concat(chunks, ignore_index=True)
+    else:
+        # File excel tanpa baris data tetap menghasilkan excel kosong dengan kolom hasil
+        data_frame = data_frame.reindex(
+            columns=[*data_frame.columns, *RESULT_COLUMNS]
+        ).drop(columns=columns_to_delete)
     data_frame.to_excel("list-provider-end.xlsx", index=False)
 
 